@@ -35,11 +35,13 @@ __version__ = '1.0.6'
 #  The usage of __main__.py is not very common, but still quite standard.
 
 def acknowledgement():
-    print('BGROUND package - semi-automatic background subtraction.')
-    print('------')
-    print('The development of the package was co-funded by')
-    print('the Technology agency of the Czech Republic,')
-    print('program NCK, project TN02000020.')
+    # The text is printed by a single print call (= one write to stdout).
+    print(
+        'BGROUND package - semi-automatic background subtraction.\n'
+        '------\n'
+        'The development of the package was co-funded by\n'
+        'the Technology agency of the Czech Republic,\n'
+        'program NCK, project TN02000020.')
     
 if __name__ == '__main__':
     acknowledgement()
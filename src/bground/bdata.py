@@ -10,38 +10,102 @@ The classes keep data for the backround definition.
     - XYpoints object = the user-defined coordinates of bkg point
     - XYcurve object = the calculated background curve
     - a few other properties (name of file for saving bkg, type of bkg)
+    - lines with bkg points and bkg curve in the interactive plot
 
 Technical notes:
 
 * The first two classes (XYpoints, XYcurve) are used just inside the 3rd one.
 * The 3rd class (bkg) is used in module iplot = the interactive bkg definition.
 * For a common user, the classes are behind the sceenes, completely invisible.
+* Function output_filenames = names of all output files for given basename
+  (shared by bground.iplot and bground.help, so that they are always same).
+* Functions background_key and same_background_key = the key of the state
+  of data and background, for which some results were calculated
+  (shared by bground.iplot and bground.ui caches of calculated results).
 '''
 
+import numpy as np
+
+
 class XYpoints:
     '''
-    XYpoints = object containing two lists X,Y.
-    The lists X,Y contain X,Y coordinates of background points.
+    XYpoints = object containing two 1D numpy arrays X,Y.
+    The arrays X,Y contain X,Y coordinates of background points.
     This simple object is used in the following bkg object below.
+    
+    Technical notes:
+    
+    * The coordinates are kept in two pre-allocated numpy arrays (buffers).
+    * Properties X,Y return views of the filled part of the buffers.
+    * If the buffers are full, they are doubled.
+    * Properties X,Y can be also set (from lists or arrays) as before;
+      nevertheless, X and Y should be always set together (same length).
+    * Attribute sorted = True if the points are sorted according to X.
+    * Empty XYpoints are sorted and add_point inserts new points
+      to the correct (sorted) position => the points stay sorted
+      and bground.bfunc.sort_bkg_points does not have to sort them again.
+    * Setting X,Y directly (such as reading points from file)
+      sets sorted = False (for 2 or more points);
+      the flag is renewed by sort_bkg_points.
     '''
     
-    def __init__(self, X=[], Y=[]):
+    def __init__(self, X=(), Y=(), capacity=64):
         '''
         Initialize XYpoints object.
 
         Parameters
         ----------
-        X : list, optional, the default is []
+        X : list or array, optional, the default is ()
             X-coordinates of user-defined background points
-        Y : list, optional, the default is []
+        Y : list or array, optional, the default is ()
             Y-coordinates of user-defined background points
+        capacity : int, optional, the default is 64
+            Initial size of the pre-allocated buffers for X,Y-coordinates.
 
         Returns
         -------
         New XYobject.
         '''
+        self._X = np.empty(capacity, dtype=np.float64)
+        self._Y = np.empty(capacity, dtype=np.float64)
+        self._n = 0
         self.X = X
         self.Y = Y
+    
+    @property
+    def X(self):
+        '''X-coordinates of background points (view of the buffer).'''
+        return(self._X[:self._n])
+    
+    @X.setter
+    def X(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self._reserve(len(values))
+        self._X[:len(values)] = values
+        self._n = len(values)
+        self.sorted = (len(values) <= 1)
+    
+    @property
+    def Y(self):
+        '''Y-coordinates of background points (view of the buffer).'''
+        return(self._Y[:self._n])
+    
+    @Y.setter
+    def Y(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self._reserve(len(values))
+        self._Y[:len(values)] = values
+        self._n = len(values)
+        self.sorted = (len(values) <= 1)
+    
+    def _reserve(self, n):
+        '''
+        Make sure that the buffers can keep at least n points.
+        '''
+        if n > len(self._X):
+            capacity = max(n, 2*len(self._X))
+            self._X = np.resize(self._X, capacity)
+            self._Y = np.resize(self._Y, capacity)
         
     def add_point(self,Xcoord,Ycoord):
         '''
@@ -58,9 +122,44 @@ class XYpoints:
         Returns
         -------
         None; just the Xcoord,Ycoord are added to XYpoints object.
+        
+        Technical note
+        --------------
+        If the points are sorted, the new point is inserted
+        to its sorted position (np.searchsorted + shift of the rest);
+        otherwise, the new point is just appended to the end.
+        '''
+        self._reserve(self._n + 1)
+        n = self._n
+        if self.sorted:
+            idx = int(np.searchsorted(self._X[:n], Xcoord, side='right'))
+            self._X[idx+1:n+1] = self._X[idx:n]
+            self._Y[idx+1:n+1] = self._Y[idx:n]
+        else:
+            idx = n
+        self._X[idx] = Xcoord
+        self._Y[idx] = Ycoord
+        self._n += 1
+    
+    def remove_point(self, idx):
+        '''
+        Remove one background point from XYpoints object.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the background point to remove.
+
+        Returns
+        -------
+        Xcoord,Ycoord : float,float
+            Coordinates of the removed background point.
         '''
-        self.X.append(Xcoord)
-        self.Y.append(Ycoord)
+        Xcoord, Ycoord = self.X[idx], self.Y[idx]
+        self._X[idx:self._n-1] = self._X[idx+1:self._n]
+        self._Y[idx:self._n-1] = self._Y[idx+1:self._n]
+        self._n -= 1
+        return(Xcoord, Ycoord)
 
 class XYcurve:
     '''
@@ -131,3 +230,86 @@ class XYbackground:
         self.points   = points
         self.curve    = curve 
         self.btype    = btype
+        # Key of the state, for which the curve was calculated
+        # (see bground.iplot.calculate_background_if_changed
+        self._curve_key = None
+        # Lines with background points and background curve
+        # in the interactive plot (Matplotlib Line2D objects)
+        # (see bground.iplot.interactive_plot
+        self.points_line = None
+        self.curve_line  = None
+
+
+def output_filenames(basename):
+    '''
+    Names of output files (TXT, BKG, PNG) for the given basename.
+
+    Parameters
+    ----------
+    basename : str
+        Basename of output file(s) = ppar.output_file = bkgr.basename.
+
+    Returns
+    -------
+    TXTfile, BKGfile, PNGfile : str
+        Names of the output files with background-corrected data,
+        background points and PNG plot.
+        The TXT extension is added only if it is not already there
+        (to avoid double TXT extension for the main TXT file).
+    '''
+    TXTfile = basename
+    BKGfile = basename + '.bkg'
+    PNGfile = basename + '.png'
+    if not(TXTfile.lower().endswith('.txt')): TXTfile = TXTfile + '.txt'
+    return(TXTfile, BKGfile, PNGfile)
+
+
+def background_key(data, bkg):
+    '''
+    Key of the state of data and background (for caches of results).
+
+    Parameters
+    ----------
+    data : 2D numpy array
+        XY-data, for which the results were calculated.
+    bkg : bdata.XYbackground object
+        Background, for which the results were calculated.
+
+    Returns
+    -------
+    key : tuple
+        The key = (data, background type, points.X, points.Y,
+        curve.X, curve.Y).
+        
+    Technical notes
+    ---------------
+    * The data and points are copied
+      => later changes, including in-place changes, change the state.
+    * The curve arrays are kept as references (not ids)
+      and compared by identity in same_background_key;
+      bground.bfunc.calculate_background always creates new curve arrays
+      => a re-calculated curve changes the state.
+    '''
+    return((data.copy(), bkg.btype, 
+            bkg.points.X.copy(), bkg.points.Y.copy(),
+            bkg.curve.X, bkg.curve.Y))
+
+
+def same_background_key(key, data, bkg):
+    '''
+    Check if the key from background_key describes the current state
+    of data and background.
+    
+    * A missing key (None) never matches.
+    * The type is compared by equality (==), the data and points
+      (numpy arrays) by np.array_equal and the curve by identity (is).
+    * The current state is not copied => the check is cheap.
+    '''
+    return(
+        key is not None
+        and key[1] == bkg.btype
+        and key[4] is bkg.curve.X
+        and key[5] is bkg.curve.Y
+        and np.array_equal(key[2], bkg.points.X)
+        and np.array_equal(key[3], bkg.points.Y)
+        and np.array_equal(key[0], data))
@@ -35,14 +35,27 @@ def sort_bkg_points(bkg):
         The result is the updated bkg object.
         The updated object contains bkg.points sorted according to
         their X-coordinate.
+        
+    Technical note
+    --------------
+    If the points are already sorted (bkg.points.sorted = True),
+    the function does nothing.
+    The points are kept sorted when they are added by add_point.
     '''
-    # Sorting is based on the trick found on www
-    # GoogleSearch: python sort two 1D arrays
-    # https://stackoverflow.com/q/9007877
+    # Points already sorted => nothing to do.
+    # (empty points are not skipped: sorting of no points raises an error,
+    # (which is ignored in the interactive plot => keys 4,5,6 do nothing
+    if bkg.points.sorted and len(bkg.points.X) > 0: return
+    # Sorting = indexes of sorted points + re-ordering of X,Y arrays
+    # (np.lexsort sorts according to X and then Y for equal X-values
+    # (= the same order as the older Python-level sorted(zip(X,Y))
     X,Y = (bkg.points.X, bkg.points.Y)
-    x,y = zip( *sorted( zip(X,Y) ) )
-    bkg.points.X = list(x)
-    bkg.points.Y = list(y)
+    if len(X) == 0:
+        raise ValueError('no background points to sort')
+    idx = np.lexsort((Y,X))
+    bkg.points.X = X[idx]
+    bkg.points.Y = Y[idx]
+    bkg.points.sorted = True
     
 def calculate_background(data,bkg):
     '''
@@ -52,8 +65,9 @@ def calculate_background(data,bkg):
     
     Parameters
     ----------
-    data : 
-        
+    data : 2D numpy array
+        The array contains two colums [X,Intensity];
+        the X-values must be sorted in ascending order.
     bkg : bground.bdata.bkg object
         Object containing the following items:
             
@@ -69,28 +83,94 @@ def calculate_background(data,bkg):
         * bkg.X = calculated X-coordinates of the whole background
         * bkg.Y = calculated Y-coordinates of the WHOLE background
     '''
-    # (1) Prepare background points = X,Y coordinates for interpolation
-    X,Y = (bkg.points.X,bkg.points.Y)
-    # (2) Interpolate background points = calculcate background curve
     try:
-        # Interpolation = calculation of interpolation function F.
-        # (F = interpolation object/function
-        # (with which we easily calculate the interpolated data - see below
-        F = interpolate.interp1d(X,Y, kind=bkg.btype)
+        # (1) Prepare background points = X,Y coordinates for interpolation
+        # (the interpolation needs points sorted according to X
+        # (points loaded from BKG-file + added later may be unsorted
+        # (sort_bkg_points does nothing if the points are already sorted
+        sort_bkg_points(bkg)
+        X,Y = (bkg.points.X,bkg.points.Y)
+        # (2) Interpolate background points = calculcate background curve
         Xmin = bkg.points.X[0]
         Xmax = bkg.points.X[-1]
-        Xnew = data[0,(Xmin<=data[0])&(data[0]<=Xmax)]
-        Ynew = F(Xnew)
+        # X-data are sorted => the range [Xmin,Xmax] is a contiguous slice
+        # (np.searchsorted = binary search, no boolean mask over all data
+        # (Xnew = view of data[0], no copy
+        i0 = np.searchsorted(data[0], Xmin, side='left')
+        i1 = np.searchsorted(data[0], Xmax, side='right')
+        Xnew = data[0,i0:i1]
+        if bkg.btype == 'linear':
+            # Linear interpolation = np.interp
+            # (a single vectorized C-loop, no interpolation object needed
+            Ynew = np.interp(Xnew, X, Y)
+        else:
+            # Other interpolations = calculation of interpolation function F.
+            # (F = interpolation object/function
+            # (with which we easily calculate the interpolated data
+            F = get_interpolation_function(bkg)
+            Ynew = F(Xnew)
+        # The curve keeps the precision of the data
+        # (np.interp and splines return float64 even for float32 data
+        # (float32 data, such as dtype=np.float32 in InputData => float32 curve
+        # (integer data of any size => float64 curve, see _curve_dtype
+        Ynew = Ynew.astype(_curve_dtype(data), copy=False)
         bkg.curve.X = Xnew
         bkg.curve.Y = Ynew
-    except Exception as err:
-        # Exceptions: interpolation can fail for whatever reason
+    except (IndexError, ValueError) as err:
+        # Exceptions: interpolation can fail for wrong background points
+        # (ValueError = no, too few or duplicate points
+        # (or unknown interpolation type; other errors are real bugs
         # In such a case we print error and return an empty array
         print(err)
         print(type(err))
         return(np.array([]))
 
-def subtract_background(data, bkg):
+
+def _curve_dtype(data):
+    '''
+    Data type of background curve for given data.
+    
+    * Float data => float32 or float64 curve, according to the data.
+    * Other data (such as integers) => float64 curve.
+      Note: np.result_type would give float32 for small integers
+      (int8, int16, uint8...), which would lose the precision.
+    '''
+    if np.issubdtype(data.dtype, np.floating):
+        return(np.result_type(data.dtype, np.float32))
+    return(np.dtype(np.float64))
+
+
+# Orders of splines for non-linear background types
+_SPLINE_ORDERS = {'quadratic':2, 'cubic':3}
+
+
+def get_interpolation_function(bkg):
+    '''
+    Get interpolation function for background points.
+
+    Parameters
+    ----------
+    bkg : bground.bdata.bkg object
+        Object containing background points (bkg.points)
+        and interpolation type (bkg.btype).
+
+    Returns
+    -------
+    F : interpolation object/function
+        Function, which calculates the background for given X-values.
+    '''
+    X,Y = (bkg.points.X,bkg.points.Y)
+    # Spline of given order
+    # (make_interp_spline = the same spline as interp1d(kind=btype),
+    # (without interp1d wrapper, which is a legacy interface in SciPy
+    order = _SPLINE_ORDERS.get(bkg.btype)
+    if order is None:
+        raise ValueError(f'unknown background type: {bkg.btype}')
+    F = interpolate.make_interp_spline(X,Y, k=order)
+    return(F)
+
+
+def subtract_background(data, bkg, out=None):
     '''
     Subtract background
     = subtract interpolated background curve from original data;
@@ -100,9 +180,14 @@ def subtract_background(data, bkg):
     ----------
     data : 2D numpy array
         The array contains two colums [X,Intensity].
+        The X-values must be sorted in ascending order
+        (the same requirement as for the interactive plot).
     bkg : bdata.bkg object
         The object contains several items,
         namely interpolated background curve.
+    out : 2D numpy array, optional, default is None
+        Pre-allocated output array with one more row than *data*.
+        If None, a new array is allocated.
 
     Returns
     -------
@@ -110,18 +195,46 @@ def subtract_background(data, bkg):
         The array with 3 columns [X,Intensity,BackgroundCorrectedIntensity].
     '''
     # (1) Add one more column to data variable.
-    data = np.insert(data,2,data[1],0)
+    # (the output array is allocated at once and the rows are just copied
+    # (= the same result as np.insert(data,2,data[1],0), without temporaries
+    # (the new row 2 is completely filled in steps (4) and (5) below
+    # (dtype of data and background => integer data give float output
+    if out is None:
+        out = np.empty((data.shape[0]+1, data.shape[1]),
+                       dtype=subtracted_dtype(data, bkg))
+    out[:2] = data[:2]
+    out[3:] = data[2:]
+    data = out
     # (2) Get Xmin and Xmax of background curve.
     Xmin = bkg.curve.X[0]
     Xmax = bkg.curve.X[-1]
-    # (3) Define range in which the backgrou5nd is subtracted.
-    bkg_range = (Xmin<=data[0]) & (data[0]<=Xmax)
+    # (3) Define range in which the background is subtracted.
+    # (X-data are sorted => the range is a contiguous slice [i0:i1]
+    # (np.searchsorted = two binary searches instead of two full comparisons
+    i0 = np.searchsorted(data[0], Xmin, side='left')
+    i1 = np.searchsorted(data[0], Xmax, side='right')
     # (4) Zero intensities below Xmin & above Xmax.
-    data[2] = np.where(bkg_range,data[1],0)
+    data[2,:i0] = 0
+    data[2,i1:] = 0
     # (5) Subtract background from intensities between Xmin and Xmax
-    data[2,bkg_range] = data[2,bkg_range] - bkg.curve.Y
+    # (out= => the result is written directly to the contiguous output row
+    Ycorr = data[2,i0:i1]
+    np.subtract(data[1,i0:i1], bkg.curve.Y, out=Ycorr)
     # (6) Set possible negative intensities after bkgr subtraction to zero
-    data[2,data[2]<0] = 0
+    # (outside the range, the intensities are already zero
+    np.maximum(Ycorr, 0, out=Ycorr)
     # (7) Return modified data array
     # (the last column the array contains background-corrected intensities
     return(data)
+
+
+def subtracted_dtype(data, bkg):
+    '''
+    Data type of background-corrected data (see subtract_background).
+    
+    * The result is the common type of data and background curve.
+    * Integer data (of any size) + float64 background
+      => float64 background-corrected data.
+    * Float32 data + float32 background => float32 background-corrected data.
+    '''
+    return(np.result_type(data.dtype, np.asarray(bkg.curve.Y).dtype))
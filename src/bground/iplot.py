@@ -16,12 +16,12 @@ Important technical notes:
 * We can define additional simple events (here: *close_event* = on closing).
 '''
 
+import warnings
+import functools
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 
 from bground import bdata, bfunc
-import warnings; warnings.filterwarnings("ignore")
 
 # =============================================================================
 # Level 1: Create plot with events
@@ -52,6 +52,13 @@ def interactive_plot(data, bkgr, ppar):
     The arguments/objects for this function (data, bkgr, ppar)
     are usually defined by means of a simple OO-interface
     before this function is called.
+    
+    The plot contains three lines: XY-data, background points
+    and background curve; the last two are kept in bkgr object:
+    bkgr.points_line (background points)
+    and bkgr.curve_line (background curve).
+    The keypress events just update these two lines (set_data);
+    the (possibly large) XY-data are plotted only once.
     '''
     
     # (0) Initialize
@@ -65,13 +72,14 @@ def interactive_plot(data, bkgr, ppar):
     # (2) Read XY data and create the plot
     # Get XY data from the function argument data
     X,Y = (data[0],data[1])
-    # Plot XY data
+    # Plot XY data + (so far empty) background points and background curve
     ax.plot(X,Y, 'b-')
+    bkgr.points_line, = ax.plot([],[], 'r+')
+    bkgr.curve_line,  = ax.plot([],[], 'r:')
     # Set the remaining plot parameters
-    ax.set_xlim(ppar.xlim)
-    ax.set_ylim(ppar.ylim)
-    ax.set_xlabel(ppar.xlabel)
-    ax.set_ylabel(ppar.ylabel)
+    # (all at once by ax.set = one update of the axes properties
+    ax.set(xlim=ppar.xlim, ylim=ppar.ylim,
+           xlabel=ppar.xlabel, ylabel=ppar.ylabel)
     
     # (3) Connect the plot with event(s)
     #   => link fig.canvas event(s) to a callback function(s).
@@ -93,7 +101,7 @@ def interactive_plot(data, bkgr, ppar):
         lambda event: on_close(event, ppar))
     
     # (4) Optimize the plot layout
-    plt.tight_layout()
+    fig.tight_layout()
     
     # (5) Return fig,ax
     # (This is necessary, among others, fof Jupyter + %matplotlib widget
@@ -108,13 +116,23 @@ def on_keypress(event, fig, ax, data, bkgr, ppar):
     Definition of key_press_events for a plot.
     
     The callback function, which defines all keypress events.
-    The functions for the individual keypress events are defined below.
+    The functions for the individual keypress events are defined below
+    and collected in KEYPRESS_FUNCTIONS dictionary.
+    
+    Keys without a function in KEYPRESS_FUNCTIONS are left to Matplotlib UI;
+    no message is printed for them (not even with ppar.messages = True),
+    neither the message with the key and mouse position
+    nor the warning about the mouse outside the plot area.
     '''
     # Step 3 in defining interactive plot
     # = defining individual functions for specific pressed keys.
     # -----
-    # Read pressed key and mouse coordinates
+    # Read pressed key and find the corresponding function
+    # (keys without function are left to Matplotlib UI => no action here
     key = event.key
+    keypress_function = KEYPRESS_FUNCTIONS.get(key)
+    if keypress_function is None: return
+    # Read mouse coordinates
     xm,ym = event.xdata,event.ydata
     # Mouse outside graph area - just print warning!
     if xm == None or ym == None:
@@ -127,18 +145,12 @@ def on_keypress(event, fig, ax, data, bkgr, ppar):
         # Functions run by means try-except
         # Reason: to ignore nonsense actions...
         # ...such as delete/draw points if no points are defined
+        # Warnings are suppressed just within the keypress function
+        # (the global warnings filters of the user are not affected
         try:
-            if   key == '1': add_bkg_point(plt,data,bkgr,ppar,xm,ym)
-            elif key == '2': del_bkg_point_close_to_mouse(plt,bkgr,ppar,xm,ym)
-            elif key == '3': replot_with_bkg_points(plt,data,bkgr,ppar)
-            elif key == '4': replot_with_bkg(plt,data,bkgr,ppar,'linear')
-            elif key == '5': replot_with_bkg(plt,data,bkgr,ppar,'quadratic')
-            elif key == '6': replot_with_bkg(plt,data,bkgr,ppar,'cubic')
-            elif key == 'a': load_bkg_points(plt,data,bkgr,ppar)
-            elif key == 'b': save_bkg_points(bkgr,ppar)
-            elif key == 't': subtract_bkg_and_save(plt, data, bkgr, ppar)
-            elif key == 's': save_PNG_image(ppar) 
-            elif ppar.messages: print() # for any other key just empty line
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                keypress_function(ax,data,bkgr,ppar,xm,ym)
         except Exception:
             pass
 
@@ -152,10 +164,7 @@ def on_close(event, ppar):
     The function just prints some concluding remarks
     and information about the output files.
     '''
-    out_file1 = ppar.output_file
-    out_file2 = ppar.output_file + '.bkg'
-    out_file3 = ppar.output_file + '.png'
-    if not(out_file1.lower().endswith('.txt')): out_file1 = out_file1 + '.txt'
+    out_file1, out_file2, out_file3 = bdata.output_filenames(ppar.output_file)
     print()
     print('The interactive plot was closed.')
     print('If you followed the instructions on www,')
@@ -168,7 +177,7 @@ def on_close(event, ppar):
 # =============================================================================
 # Level 3: Functions for individual keypress events       
 
-def add_bkg_point(plt, data, bkgr, ppar, xm, ym):
+def add_bkg_point(ax, data, bkgr, ppar, xm, ym):
     '''
     Function for keypress = '1'.
     
@@ -179,12 +188,12 @@ def add_bkg_point(plt, data, bkgr, ppar, xm, ym):
     idx = find_nearest(data[0],xm)
     xm,ym = (data[0,idx],data[1,idx])
     bkgr.points.add_point(xm,ym)
-    plt.plot(xm,ym,'r+')
-    plt.draw()
+    bkgr.points_line.set_data(bkgr.points.X, bkgr.points.Y)
+    draw_artist_only(ax, bkgr.points_line)
     if ppar.messages: print('background point added.')
     
 
-def del_bkg_point_close_to_mouse(plt, bkgr, ppar, xm, ym):
+def del_bkg_point_close_to_mouse(ax, data, bkgr, ppar, xm, ym):
     '''
     Function for keypress = '2'.
     
@@ -193,21 +202,23 @@ def del_bkg_point_close_to_mouse(plt, bkgr, ppar, xm, ym):
     whose X-coordinate is the closest to the mouse cursor X-coordinate.
     '''
     # a) Sort bkg points (sorted array is necessary for the next step)
+    # (usually no-op: the points are kept sorted when they are added
     bfunc.sort_bkg_points(bkgr)
     # b) Find index of background point closest to the mouse X-position
-    idx = find_nearest(np.array(bkgr.points.X), xm)
-    # c) Remove element with given index from X,Y-lists (save coordinates)
-    xr = bkgr.points.X.pop(idx)
-    yr = bkgr.points.Y.pop(idx)
-    # d) Redraw removed element with background color
-    plt.plot(xr,yr, 'w+')
-    # e) Redraw plot
-    plt.draw()
+    # (bkgr.points.X is a numpy array => no conversion
+    idx = find_nearest(bkgr.points.X, xm)
+    # c) Remove element with given index from X,Y-arrays
+    bkgr.points.remove_point(idx)
+    # d) Update the line with background points
+    bkgr.points_line.set_data(bkgr.points.X, bkgr.points.Y)
+    # e) Redraw plot (the removed point must disappear => whole canvas)
+    ax.figure.canvas.draw_idle()
     # f) Print message to stdout.
     if ppar.messages: print('background point deleted.')
 
 
-def replot_with_bkg_points(plt, data, bkgr, ppar, points_reloaded=False):
+def replot_with_bkg_points(
+        ax, data, bkgr, ppar, xm=None, ym=None, points_reloaded=False):
     '''
     Function for keypress = '3'.
     
@@ -217,32 +228,30 @@ def replot_with_bkg_points(plt, data, bkgr, ppar, points_reloaded=False):
     The load_bkg_points function uses its own short message
     and sets points_reloaded=True to avoid additional confusing messaging.
     '''
-    clear_plot()
-    plt.plot(data[0],data[1],'b-')
-    plt.plot(bkgr.points.X,bkgr.points.Y,'r+')
-    plt.draw()
+    bkgr.points_line.set_data(bkgr.points.X, bkgr.points.Y)
+    bkgr.curve_line.set_data([],[])
+    ax.figure.canvas.draw_idle()
     if ppar.messages == True and points_reloaded == False:
         # 
         print('backround points re-drawn.')
 
-def replot_with_bkg(plt, data, bkgr, ppar, btype):
+def replot_with_bkg(ax, data, bkgr, ppar, xm=None, ym=None, btype='linear'):
     '''
     Function for keypress = '4,5,6'.
     
     Re-draw plot with backround points and background curve.
     Type of the curve is given by parameter btype.
-    For key = 4/5/6 the function called with btype = linear/quadratic/cubic.
+    For key = 4/5/6 the function called with btype = linear/quadratic/cubic
+    (see KEYPRESS_FUNCTIONS below).
     '''
     # Sort background points + calculate background
     bfunc.sort_bkg_points(bkgr)
     bkgr.btype = btype
-    bfunc.calculate_background(data, bkgr)
-    # Clear plot + re-draw it with the background points
-    clear_plot()
-    plt.plot(data[0],data[1],'b-')
-    plt.plot(bkgr.points.X,bkgr.points.Y,'r+')
-    plt.plot(bkgr.curve.X,bkgr.curve.Y,'r:')
-    plt.draw()
+    calculate_background_if_changed(data, bkgr)
+    # Update background points and background curve + re-draw the plot
+    bkgr.points_line.set_data(bkgr.points.X, bkgr.points.Y)
+    bkgr.curve_line.set_data(bkgr.curve.X, bkgr.curve.Y)
+    ax.figure.canvas.draw_idle()
     # Print a brief message on stdout if requested
     if ppar.messages:
         if bkgr.btype == 'linear':
@@ -253,7 +262,7 @@ def replot_with_bkg(plt, data, bkgr, ppar, btype):
             print('cubic background displayed.')
 
 
-def load_bkg_points(plt, data, bkgr, ppar):
+def load_bkg_points(ax, data, bkgr, ppar, xm=None, ym=None):
     '''
     Function for keypress = 'a'.
 
@@ -266,19 +275,26 @@ def load_bkg_points(plt, data, bkgr, ppar):
     # (reason: inserting a name during an interactive plot session is a hassle
     # (solution: manual renaming of the BKG-file before running this program
     input_filename = bkgr.basename + '.bkg'
-    # b) read input file to DataFrame
-    df = pd.read_csv(input_filename, sep=r'\s+')
-    # c) initialize bkg object by means of above-read DataFrame
-    bkgr.points = bdata.XYpoints(X = list(df.X), Y = list(df.Y))
+    # b) read input file to numpy array
+    # (np.loadtxt = bulk C-reader; the 1st line = header X,Y is skipped
+    # (ndmin=2 => 2D-array also for a file with a single background point
+    # (current BKG-files have 2 columns [X,Y],
+    # (older BKG-files have 3 columns [index,X,Y] => the last two are used
+    arr = np.loadtxt(input_filename, skiprows=1, ndmin=2)
+    # c) initialize bkg object by means of above-read array
+    # (XYpoints copy the columns into their buffers
+    bkgr.points = bdata.XYpoints(X = arr[:,-2], Y = arr[:,-1])
     bkgr.btype='linear'
+    # (sorted points => the points added later are inserted in sorted order
+    if len(arr) > 0: bfunc.sort_bkg_points(bkgr)
     # d) print message if requested
     if ppar.messages:
         print(f'background points read from: [{input_filename}].')
     # e) replot with currently loaded background
-    replot_with_bkg_points(plt, data, bkgr, ppar, points_reloaded=True)
+    replot_with_bkg_points(ax, data, bkgr, ppar, points_reloaded=True)
 
 
-def save_bkg_points(bkgr, ppar):
+def save_bkg_points(ax, data, bkgr, ppar, xm=None, ym=None):
     '''
     Function for keypress = 'b'.
     
@@ -293,48 +309,54 @@ def save_bkg_points(bkgr, ppar):
     # Standard processing of event 'b' = saving of the background points.
     bfunc.sort_bkg_points(bkgr)
     output_filename = bkgr.basename + '.bkg'
-    df = bkg_to_df(bkgr)
-    with open(output_filename, 'w') as f:
-        f.write(df.to_string())
-        if ppar.messages:
-            print(f'background points saved to: [{output_filename}]')
+    # (np.savetxt = one buffered write of the whole 2-column array
+    # (tab-separated columns X,Y with header line, without index
+    # (%.17g = full float precision => the points are restored exactly
+    # (older BKG-files with index column are still readable by load_bkg_points
+    np.savetxt(output_filename,
+        np.column_stack((bkgr.points.X, bkgr.points.Y)),
+        fmt='%.17g', delimiter='\t', header='X\tY', comments='')
+    if ppar.messages:
+        print(f'background points saved to: [{output_filename}]')
     
 
-def subtract_bkg_and_save(plt, data, bkgr, ppar):
+def subtract_bkg_and_save(ax, data, bkgr, ppar, xm=None, ym=None):
     '''
     Function for keypress 't'.
     
     This is the final function which:
     
-    * Recalculates recently defined background
+    * Recalculates recently defined background (if it has changed)
     * Calculates background-corrected data = subtracts bkg from data
     * Saves the results to TXT-file with 3 cols [X, Y, bkg-corrected-Y]
     '''
     # Subtract recently defined background and save results
     # (a) Recalculate background
-    bfunc.calculate_background(data,bkgr)
+    # (only if it changed since the last keypress 4/5/6 or t
+    # (typical case: bkg displayed with 4/5/6 and saved with t => no recalc
+    calculate_background_if_changed(data,bkgr)
     # (b) Subtract background
     data = bfunc.subtract_background(data,bkgr)
     # (c) Save background-corrected data to TXT-file
     # (we will use ppar object properties for this
     # (ppar.output_file = output file name, ppar.xlabel = label of X-data...
-    output_filename = ppar.output_file
-    if not(output_filename.lower().endswith('.txt')):
-        output_filename = output_filename + '.txt'
+    output_filename, _, _ = bdata.output_filenames(ppar.output_file)
     file_header = (
         f'Columns: {ppar.xlabel}, {ppar.ylabel}, ' +
         f'background-corrected-{ppar.ylabel}\n' +
         f'Background correction type: {bkgr.btype}')
+    # (np.savetxt writes the array row by row => data as C-contiguous columns
+    # (np.transpose alone = strided view; each output row is gathered from it
     np.savetxt(
         output_filename, 
-        np.transpose(data),
+        np.ascontiguousarray(data.T),
         fmt=('%8.3f','%11.3e','%11.3e'),
         header=file_header)
     if ppar.messages:
         print(f'backround-corrected data saved to: [{output_filename}]')
 
 
-def save_PNG_image(ppar):
+def save_PNG_image(ax, data, bkgr, ppar, xm=None, ym=None):
     '''
     Function for keypress 's'.
     
@@ -361,6 +383,23 @@ def save_PNG_image(ppar):
         print(f'plot saved to PNG; recommended name: [{output_filename}]')
 
 
+# Keys and the corresponding functions (= keypress events)
+# (all functions have the same arguments: ax,data,bkgr,ppar,xm,ym
+# (on_keypress just looks up the function instead of a long if-elif chain
+# (the mouse position xm,ym is used only by the functions for keys 1,2
+KEYPRESS_FUNCTIONS = {
+    '1': add_bkg_point,
+    '2': del_bkg_point_close_to_mouse,
+    '3': replot_with_bkg_points,
+    '4': functools.partial(replot_with_bkg, btype='linear'),
+    '5': functools.partial(replot_with_bkg, btype='quadratic'),
+    '6': functools.partial(replot_with_bkg, btype='cubic'),
+    'a': load_bkg_points,
+    'b': save_bkg_points,
+    't': subtract_bkg_and_save,
+    's': save_PNG_image}
+
+
 # =============================================================================
 # Level 4: Auxiliary functions for the interactive plot
 
@@ -376,6 +415,20 @@ def initialize_interactive_plot_parameters():
         'lines.linewidth' : 1.0})
 
 
+# Text of the ultra-brief help (printed at once by print_brief_help)
+_BRIEF_HELP = '''\
+(0) Click on the newly-opened window {Background correction},
+    which is a Matplotlib interative figure with extra shortcuts.
+(1) Use Matplotlib UI + keyboard shortcuts to define a background:
+    1,2 = add/delete a background point close to the mouse cursor
+    3,4,5,6 = show bkg points + linear/quadratic/cubic background
+(2) Save the results + close the window when you are done:
+    b = save the background points as a BKG-file (a = restore)
+    t = subtract the background & save the result as a TXT-file
+(3) Detailed help, complete documentation, and worked examples:
+    https://mirekslouf.github.io/bground/docs'''
+
+
 def print_brief_help(ppar):
     '''
     Print ultra-brief help before activating the interactive plot.
@@ -392,18 +445,12 @@ def print_brief_help(ppar):
     None
         The output is the brief help printed on stdout.
     '''
-    print('(0) Click on the newly-opened window {Background correction},')
-    print('    which is a Matplotlib interative figure with extra shortcuts.')
-    print('(1) Use Matplotlib UI + keyboard shortcuts to define a background:')
-    print('    1,2 = add/delete a background point close to the mouse cursor')
-    print('    3,4,5,6 = show bkg points + linear/quadratic/cubic background')
-    print('(2) Save the results + close the window when you are done:')
-    print('    b = save the background points as a BKG-file (a = restore)')
-    print('    t = subtract the background & save the result as a TXT-file')
-    print('(3) Detailed help, complete documentation, and worked examples:')
-    print('    https://mirekslouf.github.io/bground/docs')
+    # The whole help is printed at once (one print instead of ten).
     # Add an extra empty line if short messages to stdoud should be printed.
-    if ppar.messages: print()
+    if ppar.messages:
+        print(_BRIEF_HELP + '\n')
+    else:
+        print(_BRIEF_HELP)
 
 
 def find_nearest(arr, value):
@@ -437,35 +484,47 @@ def find_nearest(arr, value):
         return(idx)
 
 
-def clear_plot():
+def calculate_background_if_changed(data, bkgr):
     '''
-    Auxilliary function: clear interactive plot before re-drawing.
+    Auxilliary function: calculate background only if it may have changed.
     
     Key feature of the function:
-    It keeps current labels and XY-limits of the plot.
+    The background curve is re-calculated only if the data,
+    the background type or the background points changed
+    since the last successful calculation;
+    otherwise the already calculated bkgr.curve is kept.
+    (Typical case: the user switches among keys 3,4,5,6
+    without changing the background points.)
     '''
-    my_xlabel = plt.gca().get_xlabel()
-    my_ylabel = plt.gca().get_ylabel()
-    my_xlim = plt.xlim()
-    my_ylim = plt.ylim()
-    plt.cla()
-    plt.xlabel(my_xlabel)
-    plt.ylabel(my_ylabel)
-    plt.xlim(my_xlim)
-    plt.ylim(my_ylim)
-    
+    if bdata.same_background_key(bkgr._curve_key, data, bkgr):
+        return
+    # calculate_background returns an empty array if the calculation fails
+    # => the key is saved only after a successful calculation
+    # (the key is taken after the calculation, which may sort the points
+    if bfunc.calculate_background(data, bkgr) is None:
+        bkgr._curve_key = bdata.background_key(data, bkgr)
 
-def bkg_to_df(bkgr):
+
+def draw_artist_only(ax, artist):
     '''
-    Auxiliary function: Convert current background points to dataframe.
+    Auxilliary function: show an updated artist without full redraw.
     
-    Why this function?
-    => df can be used to save/restore background points nicely.
-    '''
-    # Convert bkg to DataFrame to get nicely formated output
-    # (our trick: df.to_string & then print/save to file as string
-    # (more straightforward: df.to_csv('something.txt', sep='\t')
-    # (BUT the output with to_string has better-aligned columns
-    df = pd.DataFrame(
-        np.transpose([bkgr.points.X, bkgr.points.Y]), columns=['X','Y'])
-    return(df)
+    Key feature of the function:
+    If the canvas supports blitting, only the artist is drawn
+    over the current canvas and blitted to the screen;
+    the full (expensive) redraw of the whole data line is skipped.
+    Otherwise, the standard (idle) redraw of the figure is requested.
+    The artist is a regular one, so it is kept in all subsequent redraws.
+    Limitation: the old content of the canvas is not erased
+    => the function is suitable for artists that have just grew
+    (such as the line with background points after adding a point).
+    '''
+    canvas = ax.figure.canvas
+    if getattr(canvas, 'supports_blit', False):
+        try:
+            ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+            return
+        except Exception:
+            pass
+    canvas.draw_idle()
@@ -31,10 +31,25 @@ The module defines a UI (user interface) for BGROUND package.
 >>> IPLOT.run()
 '''
 
+import os
+import functools
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
-import bground.bdata, bground.bfunc, bground.help, bground.iplot
+
+# Lazy imports
+# (matplotlib, pyplot and all bground sub-modules, including bground.help,
+# (are imported within the functions/methods, which really need them
+# (reason: import bground.ui should be fast, matplotlib import takes long
+
+# Constants for set_plot_parameters function
+# (conversion factor [cm] => [inch] and reasonable additional defaults
+_CM = 1.0/2.54
+_DEFAULTS = {
+    'lines.linewidth'    : 0.8,
+    'axes.linewidth'     : 0.6,
+    'xtick.major.width'  : 0.6,
+    'ytick.major.width'  : 0.6,
+    'grid.linewidth'     : 0.6,
+    'grid.linestyle'     : ':'}
 
 
 def set_plot_parameters(
@@ -62,27 +77,46 @@ def set_plot_parameters(
     None
         The result is a modification of the global plt.rcParams variable.
     '''
+    # (0) Lazy import of pyplot ----------------------------------------------
+    import matplotlib.pyplot as plt
     # (1) Basic arguments -----------------------------------------------------
+    # (all parameters are collected in one dict => one rcParams update below
+    params = {}
     if size:  # Figure size
         # Convert size in [cm] to required size in [inch]
-        size = (size[0]/2.54, size[1]/2.54)
-        plt.rcParams.update({'figure.figsize' : size})
+        params['figure.figsize'] = (size[0]*_CM, size[1]*_CM)
     if dpi:  # Figure dpi
-        plt.rcParams.update({'figure.dpi' : dpi})
+        params['figure.dpi'] = dpi
     if fontsize:  # Global font size
-        plt.rcParams.update({'font.size' : fontsize})
+        params['font.size'] = fontsize
     # (2) Additional default parameters ---------------------------------------
     if my_defaults:  # Default rcParams if not forbidden by my_defaults=False
-        plt.rcParams.update({
-            'lines.linewidth'    : 0.8,
-            'axes.linewidth'     : 0.6,
-            'xtick.major.width'  : 0.6,
-            'ytick.major.width'  : 0.6,
-            'grid.linewidth'     : 0.6,
-            'grid.linestyle'     : ':'})
+        params.update(_DEFAULTS)
     # (3) Further user-defined parameter in rcParams format -------------------
     if my_rcParams:  # Other possible rcParams in the form of dictionary
-        plt.rcParams.update(my_rcParams)
+        params.update(my_rcParams)
+    # (4) Update rcParams -----------------------------------------------------
+    # (only the changed parameters are updated
+    # (reason: each update runs matplotlib validators, which are slow
+    # (typical case: repeated calls of this function in Jupyter cells
+    params = {
+        key:value for key,value in params.items()
+        if not _rc_param_is_set(plt.rcParams, key, value)}
+    if params:
+        plt.rcParams.update(params)
+
+
+def _rc_param_is_set(rcParams, key, value):
+    '''
+    Check if the rcParams[key] already has the (not yet validated) value.
+    '''
+    current = rcParams.get(key)
+    # Tuples are stored as lists in rcParams (such as figure.figsize)
+    if isinstance(value, tuple): value = list(value)
+    try:
+        return(bool(current == value))
+    except Exception:
+        return(False)
 
 
 class InputData:
@@ -92,6 +126,20 @@ class InputData:
     * InputData class is a simple wrapper to `numpy.loadtxt` function.
     * All arguments from the object initialization go to this function.
     * The exception is the auto-set of `unpack=True` if *unpack* not defined.
+    * Old numpy versions (<1.23) have a slow, pure-Python `numpy.loadtxt`;
+      in such a case, simple numeric files are read by a faster pandas reader;
+      the result is the same as from `numpy.loadtxt`;
+      the fast reader can be switched off by an extra argument `fast=False`.
+    * Files are read only once (until they change); each InputData object
+      gets its own copy of the data => *data* can be modified in place.
+    * Binary numpy files (`*.npy`) are read by `numpy.load`;
+      the saved array should have the same layout as the text file
+      (= rows with XY-values); arguments *unpack*, *usecols*,
+      *skiprows* and *max_rows* work as in `numpy.loadtxt`.
+    * The data are float64 by default (as in `numpy.loadtxt`);
+      large spectra can be read with `dtype=numpy.float32`,
+      which halves the memory and the calculated background
+      and background-corrected data are then float32 as well.
     
     The usage of InputData class is shown in the example above.
     
@@ -126,17 +174,174 @@ class InputData:
         # set unpack=True (we expect data in columns, not in rows).
         if not 'unpack' in kwargs.keys(): kwargs.update({'unpack':True})
         
-        # (2) Load data using np.loadtxt.
+        # (2) Load data using np.loadtxt - or re-use the cached data.
         # (This method is basically a wrapper of np.loadtxt,
         # (i.e. all arguments given to this function transfer to np.loadtxt
         # => more help on all optional aguments: GoogleSearch numpy.loadtxt
-        data = np.loadtxt(input_file, **kwargs)
+        # (The data are cached for the given file name, size and mtime
+        # (=> re-running of a Jupyter cell does not re-read the unchanged file
+        key = _input_file_cache_key(input_file, kwargs)
+        if key is not None:
+            # (the cached array is shared and read-only
+            # (=> each InputData gets its own writeable copy
+            # (a copy of the array is much faster than re-reading the file
+            data = _load_input_file_cached(*key).copy()
+        else:
+            data = _load_input_file(input_file, **kwargs)
         
         # (3) Return the result = 2xN numpy array with XY-data.
         # (i.e. data[0] = X-data/values, data[1] = Y-data/values)
         return(data)
 
 
+def _load_input_file(input_file, fast=True, **kwargs):
+    '''
+    Load XY-data with np.loadtxt and return them as C-contiguous array.
+    
+    * If fast=True and the kwargs permit it, a faster reader can be used.
+    * The faster reader = pandas.read_csv with C-parser (see below).
+    * It is used only for old numpy, where np.loadtxt is pure Python;
+      since numpy 1.23, np.loadtxt has its own C-parser, which is faster.
+    '''
+    # (1) Load data using np.load, the fast reader or np.loadtxt.
+    # (binary *.npy files are read by np.load => no text parsing at all
+    # (if the fast reader fails for whatever reason, we use np.loadtxt
+    # (=> the result and possible error messages are those of np.loadtxt
+    data = None
+    if _is_npy_file(input_file):
+        data = _read_npy_file(input_file, **kwargs)
+    elif fast and _SLOW_LOADTXT and _fast_reader_can_read(kwargs):
+        try:
+            data = _read_input_file_fast(input_file, **kwargs)
+        except Exception:
+            data = None
+            if hasattr(input_file, 'seek'): input_file.seek(0)
+    if data is None:
+        data = np.loadtxt(input_file, **kwargs)
+    # (2) Make the rows of the array contiguous in memory.
+    # (np.loadtxt with unpack=True returns a transposed view,
+    # (in which X- and Y-values are strided => slow row-wise access
+    # (all subsequent calculations work with rows = data[0], data[1]
+    data = np.ascontiguousarray(data)
+    return(data)
+
+
+def _is_npy_file(input_file):
+    '''
+    Check if input_file is a name of binary numpy file (*.npy).
+    '''
+    return(isinstance(input_file, (str, os.PathLike))
+           and os.fspath(input_file).lower().endswith('.npy'))
+
+
+def _read_npy_file(input_file, unpack=False, usecols=None, 
+        skiprows=0, max_rows=None, dtype=None, **kwargs):
+    '''
+    Read binary numpy file (*.npy) like np.loadtxt reads a text file.
+    
+    * The file is read at once by np.load (no text parsing at all).
+    * The file is not memory-mapped: the data are made contiguous
+      in _load_input_file (unpack=True => transposed copy),
+      which would read the whole mapped file anyway.
+    * The arguments have the same meaning as in np.loadtxt.
+    * The remaining np.loadtxt arguments (comments, delimiter...)
+      concern text files only => they are ignored.
+    '''
+    data = np.load(input_file)
+    stop = None if max_rows is None else skiprows + max_rows
+    data = data[skiprows:stop]
+    if usecols is not None: data = data[:, usecols]
+    if dtype is not None: data = data.astype(dtype, copy=False)
+    if unpack: data = data.T
+    return(data)
+
+
+# Numpy versions < 1.23 have a slow, pure-Python implementation of np.loadtxt
+_SLOW_LOADTXT = tuple(int(v) for v in np.__version__.split('.')[:2]) < (1,23)
+
+# Keyword arguments of np.loadtxt, which are understood by the fast reader
+# (max_rows is not among them: old np.loadtxt counts all lines in max_rows,
+# (including comment lines, while pandas counts just the lines with data
+_FAST_READER_KWARGS = {
+    'unpack', 'usecols', 'skiprows', 'comments', 'delimiter', 'dtype'}
+
+
+def _fast_reader_can_read(kwargs):
+    '''
+    Check if the np.loadtxt kwargs can be handled by _read_input_file_fast.
+    '''
+    if not set(kwargs.keys()) <= _FAST_READER_KWARGS:
+        return(False)
+    if 'dtype' in kwargs and np.dtype(kwargs['dtype']) != np.float64:
+        return(False)
+    comments = kwargs.get('comments', '#')
+    if comments is not None and not (
+            isinstance(comments, str) and len(comments) == 1):
+        return(False)
+    if np.ndim(kwargs.get('usecols', [])) != 1:
+        return(False)
+    return(True)
+
+
+def _read_input_file_fast(input_file, unpack=False, usecols=None, 
+        skiprows=0, comments='#', delimiter=None, dtype=np.float64):
+    '''
+    Fast replacement of np.loadtxt for simple numeric files.
+    
+    * The function employs pandas.read_csv with C-parser.
+    * The arguments have the same meaning as in np.loadtxt.
+    * The output array has the same shape as the output of np.loadtxt.
+    '''
+    import pandas as pd
+    df = pd.read_csv(
+        input_file, sep=(r'\s+' if delimiter is None else delimiter),
+        header=None, usecols=usecols, skiprows=skiprows,
+        comment=comments, dtype=np.float64, engine='c',
+        float_precision='round_trip')
+    # Output array
+    # (the columns are in the order given by usecols, like in np.loadtxt
+    # (np.squeeze => dimensions of size 1 are removed, like in np.loadtxt
+    if usecols is not None: df = df[list(usecols)]
+    data = np.squeeze(df.to_numpy())
+    if unpack: data = data.T
+    return(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_input_file_cached(input_file, mtime_ns, size, kwargs_items):
+    '''
+    Cached version of _load_input_file.
+    
+    * The mtime_ns and size arguments are not used directly.
+    * They are a part of the cache key => a modified file is re-read.
+    * The returned array is read-only, because it is shared by all callers.
+    '''
+    data = _load_input_file(input_file, **dict(kwargs_items))
+    data.setflags(write=False)
+    return(data)
+
+
+def _input_file_cache_key(input_file, kwargs):
+    '''
+    Cache key for _load_input_file_cached: (path, mtime, size, kwargs).
+    
+    The function returns None if the data cannot be cached,
+    i.e. if input_file is not a file name (but a file object, for example)
+    or if some of the keyword arguments are not hashable.
+    '''
+    try:
+        st = os.stat(input_file)
+        # Lists (such as usecols=[0,1]) are not hashable => convert to tuples
+        kwargs_items = tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k,v in kwargs.items()))
+        key = (os.path.abspath(input_file),
+               st.st_mtime_ns, st.st_size, kwargs_items)
+        hash(key)
+    except (TypeError, ValueError, OSError):
+        return(None)
+    return(key)
+
 
 class PlotParams:
     '''
@@ -169,8 +374,8 @@ class PlotParams:
         self.output_file = output_file  # Name of the output file(s)
         self.xlabel = xlabel            # x-axis label of the interactive plot
         self.ylabel = ylabel            # y-axis label of the interactive plot
-        self.xlim = xlim                # [xmin,xmax] range of x-axis
-        self.ylim = ylim                # [ymin,ymax] range of y-axis
+        self.xlim = _as_limits(xlim)    # (xmin,xmax) range of x-axis
+        self.ylim = _as_limits(ylim)    # (ymin,ymax) range of y-axis
         self.messages = messages        # Printing of short messages to stdout
         
         # Note: messages argument determines,
@@ -179,6 +384,22 @@ class PlotParams:
         # the reasons are explained below in InteractivPlot object definition.
 
 
+def _as_limits(limits):
+    '''
+    Normalize axis limits to a tuple (min,max).
+    
+    * List, tuple or array with two values => tuple (min,max).
+    * Single number => tuple (0,number).
+    * None => None (= the limits will be set automatically).
+    '''
+    if limits is None:
+        return(None)
+    elif np.ndim(limits) == 0:
+        return((0, limits))
+    else:
+        return(tuple(limits))
+
+
 class InteractivePlot:
     '''
     The interactive plot employed in background removal.
@@ -215,16 +436,20 @@ class InteractivePlot:
         self.data = DATA
         self.ppar = PPAR
         
+        # Lazy import of the module with background data structures
+        import bground.bdata
+        
         # Additional property - empty XYbackground object
         # (this object is defined as a semi-empty object here
         # (the only argument we supply is the name of the output file
         self.background = bground.bdata.XYbackground(self.ppar.output_file)
             
-        # Initialize specific interactive backend
-        # in case Python runs in CLI = Command Line Interface,
-        # i.e. if the program runs outside Spyder or Jupyter environments
-        if CLI == True:
-            matplotlib.use('QtAgg')
+        # CLI property
+        # (if CLI == True, a specific interactive backend is initialized
+        # (in case Python runs in CLI = Command Line Interface,
+        # (i.e. if the program runs outside Spyder or Jupyter environments
+        # (the backend is set in self.run() => Qt is loaded only when needed
+        self._cli = CLI
 
         # Messages property
         # (If messages=True, short messages are printed on stdout
@@ -236,6 +461,23 @@ class InteractivePlot:
         self.messages = messages
         self.ppar.messages = messages
         
+        # Cache for background-corrected data
+        # (the cache = (key, data_corr), where key describes the background
+        # (it is used in plot_data_after_bkgr_subtraction method
+        # (=> the background is not re-subtracted if it has not changed
+        self._sub_cache = (None, None)
+        # (the re-subtracted data are written to one pre-allocated buffer
+        # (=> no new array for each change of the background
+        self._sub_buffer = None
+        
+        # Figure, axes and lines of the supplementary plot_data_* methods
+        # (they are re-used in the subsequent calls of plot_data_* methods
+        # (=> the plot is just updated and not created from scratch
+        self._preview_fig = None
+        self._preview_ax = None
+        self._preview_lines = []
+        self._preview_styles = []
+        
     def run(self):
         '''
         Run the interactive plot.
@@ -254,10 +496,23 @@ class InteractivePlot:
         # * In addition, it does a few minor things.
         # * It takes no parameters - everything is in InteractivePlot object.
         
+        # Lazy import of pyplot and the module with the interactive plot
+        import matplotlib.pyplot as plt
+        import bground.iplot
+        
+        # Initialize specific interactive backend for CLI runs.
+        # (pyplot is imported first => matplotlib.use switches the backend
+        # (force=False => if Qt is not available, keep the current backend
+        if self._cli == True:
+            import matplotlib
+            matplotlib.use('QtAgg', force=False)
+        
         # Clear background points from possible previous runs.
         # (Possible issue in Jupyter, when re-running cell with the command.
         self.background.points.X = []
         self.background.points.Y = []
+        # ...and invalidate the background-corrected data from previous runs.
+        self.invalidate_background()
         
         # Run the interactive plot
         # (the return values seem to be necessary for current Jupyter interface
@@ -270,14 +525,131 @@ class InteractivePlot:
         # (CLI in standard python, Console in Spyder, output cell in Jupyter).
         bground.iplot.print_brief_help(self.ppar)
         
-        # Optimize the layout of the returned figure.
+        # The layout of the figure was already optimized (tight_layout)
+        # in interactive_plot => no second layout pass is needed here.
         # (this works in all three supported interfaces: CLI, Spyder, Jupyter)
-        fig.tight_layout()
         
         # Show the plot
         plt.show()
 
 
+    def invalidate_background(self):
+        '''
+        Forget the cached background-corrected data.
+        
+        Technical notes
+        ---------------
+        * The background-corrected data are cached
+          in plot_data_after_bkgr_subtraction method.
+        * The cache is invalidated automatically, if the background changes.
+        * This method just forces the re-calculation in the next call.
+        '''
+        self._sub_cache = (None, None)
+
+
+    def _sub_cache_valid(self, data, bkgr):
+        '''
+        Check if the cached background-corrected data match
+        the current data and background.
+        
+        * key = (data, background type, points.X, points.Y, curve.X, curve.Y)
+        * The key is created and compared by bground.bdata functions
+          background_key and same_background_key.
+        '''
+        import bground.bdata
+        return(bground.bdata.same_background_key(
+            self._sub_cache[0], data, bkgr))
+
+
+    def _render(self, layers, title, xlim=None, ylim=None, grid=True):
+        '''
+        Common code of the supplementary plot_data_* methods.
+
+        Parameters
+        ----------
+        layers : list of tuples (X,Y,style)
+            XY-data and matplotlib format string for each line of the plot.
+        title : str or None
+            Title of the plot; None = no title.
+        xlim, ylim : tuple or list with two values, default is None
+            X,Y-axis limits; None = the limits are taken from self.ppar.
+        grid : bool, optional, default is True
+            If true, show grid in the plot.
+
+        Returns
+        -------
+        None
+            The result is the plot shown on the screen.
+        
+        Technical notes
+        ---------------
+        * The figure, axes and lines are kept in the InteractivePlot object.
+        * If the figure is still open, it is re-used (no new figure).
+        * If it contains the same types of lines,
+          the lines are just updated (set_data) instead of re-plotting.
+        * If it contains other lines, the axes are cleared and re-plotted.
+        * If the figure was closed, a new figure is created.
+        '''
+        import matplotlib.pyplot as plt
+        # (1) Get the figure and draw the lines
+        fig = self._preview_fig
+        styles = [style for X,Y,style in layers]
+        if fig is not None and plt.fignum_exists(fig.number):
+            # Close all other plots and make the figure current.
+            # (necessary to avoid confusions about current plot in Jupyter
+            for num in plt.get_fignums():
+                if num != fig.number: plt.close(num)
+            plt.figure(fig.number)
+            ax = self._preview_ax
+            if styles == self._preview_styles:
+                # Update the existing lines + rescale the axes
+                # (explicit xlim/ylim of a previous call switched autoscale off
+                # (=> switch it on again; explicit limits are set in _style
+                for line,(X,Y,style) in zip(self._preview_lines, layers):
+                    line.set_data(X,Y)
+                ax.autoscale(True)
+                ax.relim()
+                ax.autoscale_view()
+            else:
+                # Different lines => clear the axes and re-plot
+                ax.cla()
+                self._preview_lines = [ax.plot(X,Y,style)[0] 
+                                       for X,Y,style in layers]
+                self._preview_styles = styles
+        else:
+            # Close all previous plots and create a new figure.
+            plt.close('all')
+            fig,ax = plt.subplots()
+            self._preview_fig, self._preview_ax = fig, ax
+            self._preview_lines = [ax.plot(X,Y,style)[0] 
+                                   for X,Y,style in layers]
+            self._preview_styles = styles
+        # (2) Add title, xy-labels, xy-limits and grid
+        if xlim is None: xlim = self.ppar.xlim
+        if ylim is None: ylim = self.ppar.ylim
+        self._style(self._preview_ax, title, xlim, ylim, grid)
+        # (3) Show the final plot
+        fig.tight_layout()
+        plt.show()
+
+
+    def _style(self, ax, title, xlim, ylim, grid):
+        '''
+        Set title, xy-labels, xy-limits and grid of the axes.
+        
+        * The labels are taken from self.ppar.
+        * All properties are set at once by ax.set (= faster than plt.xlabel,
+          plt.ylabel..., each of which looks for current figure and axes).
+        * Title and grid are set explicitly, even if they are None/False,
+          in order to remove title/grid from a re-used plot.
+        '''
+        ax.set(
+            title=('' if title is None else title),
+            xlabel=self.ppar.xlabel, ylabel=self.ppar.ylabel,
+            xlim=xlim, ylim=ylim)
+        ax.grid(bool(grid))
+
+
     def plot_data_before_processing(
             self, title='Raw data before processing', grid=True):
         '''
@@ -314,26 +686,10 @@ class InteractivePlot:
           current active plot.
         '''        
 
-        # Close all previous plots.
-        # (necessary to avoid confusions about current plot in Jupyter
-        plt.close('all')
         # Get XY-data
         X,Y = self.data.data
-        # PLot XY-data
-        plt.plot(X,Y, 'b-')
-        if title is not None:
-            plt.title(title)
-        # ...add xy-labels and limits
-        plt.xlabel(self.ppar.xlabel)
-        plt.ylabel(self.ppar.ylabel)
-        plt.xlim(self.ppar.xlim)
-        plt.ylim (self.ppar.ylim)
-        # ...add grid
-        if grid is not None:
-            plt.grid()
-        # Show the final plot
-        plt.tight_layout()
-        plt.show()
+        # Plot XY-data
+        self._render([(X,Y,'b-')], title, grid=grid)
 
 
     def plot_data_with_bkgr_definition(
@@ -372,9 +728,6 @@ class InteractivePlot:
           current active plot.
         '''
         
-        # Close all previous plots.
-        # (necessary to avoid confusions about current plot in Jupyter
-        plt.close('all')
         # Get XY-data
         X,Y = self.data.data
         # Get background points
@@ -383,26 +736,9 @@ class InteractivePlot:
         # Get background interpolation curve
         Xc = self.background.curve.X
         Yc = self.background.curve.Y
-        # PLot XY-data
-        plt.plot(X,Y, 'b-')
-        # ...add background points
-        plt.plot(Xp,Yp, 'r+')
-        # ...background interpolation curve
-        plt.plot(Xc,Yc, 'r--')
-        # ...add title
-        if title is not None:
-            plt.title(title)
-        # ...add xy-labels and limits
-        plt.xlabel(self.ppar.xlabel)
-        plt.ylabel(self.ppar.ylabel)
-        plt.xlim(self.ppar.xlim)
-        plt.ylim (self.ppar.ylim)
-        # ...add grid
-        if grid is not None:
-            plt.grid()
-        # Show the final plot
-        plt.tight_layout()
-        plt.show()
+        # Plot XY-data, background points and background interpolation curve
+        self._render(
+            [(X,Y,'b-'), (Xp,Yp,'r+'), (Xc,Yc,'r--')], title, grid=grid)
         
     def plot_data_after_bkgr_subtraction(
             self, title='Data after background subtraction', 
@@ -437,36 +773,34 @@ class InteractivePlot:
           bground.ui.InteractivePlot.show_data_after_background_definition.
         '''
         
-        # Close all previous plots.
-        # (necessary to avoid confusions about current plot in Jupyter
-        plt.close('all')
         # Get XY-data
         data = self.data.data
         # Get background object
         bkgr = self.background
         # Re-perform background subtraction
-        data_corr = bground.bfunc.subtract_background(data, bkgr)
+        # (only if data or background changed since the last call
+        if self._sub_cache_valid(data, bkgr):
+            data_corr = self._sub_cache[1]
+        else:
+            # (lazy import of the modules with background data and functions
+            import bground.bdata, bground.bfunc
+            # (the buffer has one more row than data, see subtract_background
+            # (it is re-allocated only if the shape or type of data changed
+            shape = (data.shape[0]+1, data.shape[1])
+            dtype = bground.bfunc.subtracted_dtype(data, bkgr)
+            if (self._sub_buffer is None 
+                    or self._sub_buffer.shape != shape
+                    or self._sub_buffer.dtype != dtype):
+                self._sub_buffer = np.empty(shape, dtype=dtype)
+            data_corr = bground.bfunc.subtract_background(
+                data, bkgr, out=self._sub_buffer)
+            self._sub_cache = (
+                bground.bdata.background_key(data, bkgr), data_corr)
         X,Y = data_corr[0],data_corr[2]
         # Plot background-corrected XY-data
-        plt.plot(X,Y, 'b-')
-        # ...add title
-        if title is not None:
-            plt.title(title)
-        # ...add xy-labels
-        plt.xlabel(self.ppar.xlabel)
-        plt.ylabel(self.ppar.ylabel)
-        # ...add xy-limits
-        if xlim is None: xlim = self.ppar.xlim
-        if ylim is None: ylim = self.ppar.ylim
-        plt.xlim(xlim)
-        plt.ylim(ylim)
-        # ...add grid
-        if grid is not None:
-            plt.grid()
-        # Show the final plot
-        plt.tight_layout()
-        plt.show()
+        self._render([(X,Y,'b-')], title, xlim, ylim, grid)
         
+    @staticmethod
     def print_general_help():
         '''
         Print help - BGROUND :: general help
@@ -476,8 +810,10 @@ class InteractivePlot:
         None
             The result is the help text printed on stdout.
         '''
-        bground.help.print_general_help()
+        import bground.help
+        bground.help.print_general_description()
     
+    @staticmethod
     def print_how_it_works():
         '''
         Print help - BGROUND :: How it works?
@@ -487,8 +823,10 @@ class InteractivePlot:
         None
             The result is the help text printed on stdout.
         '''
-        bground.help.print_all_keyboard_shortcuts()
+        import bground.help
+        bground.help.print_how_it_works()
         
+    @staticmethod
     def print_all_keyboard_shortcuts(output_file='output_file.txt'):
         '''
         Print help - BGROUND :: Interactive plot :: Keyboard shortcuts
@@ -505,8 +843,10 @@ class InteractivePlot:
         None
             The result is the help text printed on stdout.
         '''
+        import bground.help
         bground.help.print_all_keyboard_shortcuts(output_file)
         
+    @staticmethod
     def print_info_about_more_help_on_www():
         '''
         Print help - BGROUND package :: Additional help on www
@@ -516,7 +856,8 @@ class InteractivePlot:
         None
             The result is the help text printed on stdout.
         '''
-        bground.help.print_info_about_more_help_on_www()
+        import bground.help
+        bground.help.print_info_about_additional_help_on_www()
 
             
             
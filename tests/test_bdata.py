@@ -0,0 +1,49 @@
+'''
+Tests of bground.bdata module.
+'''
+
+import unittest
+
+import numpy as np
+
+from bground import bdata
+
+
+class BackgroundKeyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = np.vstack((np.arange(10.0), np.ones(10)))
+        self.bkg = bdata.XYbackground(
+            'out', points=bdata.XYpoints([1,5],[1,2]), curve=bdata.XYcurve())
+
+    def test_same_state(self):
+        key = bdata.background_key(self.data, self.bkg)
+        self.assertTrue(bdata.same_background_key(key, self.data, self.bkg))
+        self.assertTrue(
+            bdata.same_background_key(key, self.data.copy(), self.bkg))
+
+    def test_changed_data(self):
+        key = bdata.background_key(self.data, self.bkg)
+        self.data[1] += 1
+        self.assertFalse(bdata.same_background_key(key, self.data, self.bkg))
+
+    def test_changed_background(self):
+        key = bdata.background_key(self.data, self.bkg)
+        self.bkg.points.add_point(3, 1)
+        self.assertFalse(bdata.same_background_key(key, self.data, self.bkg))
+        key = bdata.background_key(self.data, self.bkg)
+        self.bkg.btype = 'cubic'
+        self.assertFalse(bdata.same_background_key(key, self.data, self.bkg))
+
+    def test_changed_curve(self):
+        key = bdata.background_key(self.data, self.bkg)
+        self.bkg.curve.X = np.array([1.0, 5.0])
+        self.bkg.curve.Y = np.array([1.0, 2.0])
+        self.assertFalse(bdata.same_background_key(key, self.data, self.bkg))
+
+    def test_missing_key(self):
+        self.assertFalse(bdata.same_background_key(None, self.data, self.bkg))
+
+
+if __name__ == '__main__':
+    unittest.main()
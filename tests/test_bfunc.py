@@ -0,0 +1,51 @@
+'''
+Tests of bground.bfunc module.
+'''
+
+import unittest
+
+import numpy as np
+
+from bground import bdata, bfunc
+
+
+def background(X, Y, btype='linear'):
+    '''
+    New background with the given points.
+    '''
+    bkg = bdata.XYbackground(
+        'out', points=bdata.XYpoints(), curve=bdata.XYcurve(), btype=btype)
+    for x,y in zip(X,Y): bkg.points.add_point(x,y)
+    return(bkg)
+
+
+class SubtractBackgroundTest(unittest.TestCase):
+
+    def test_integer_data(self):
+        X = np.arange(0, 101)
+        data = np.vstack((X, 10 + X//2))
+        bkg = background([10, 90], [10, 50])
+        bfunc.calculate_background(data, bkg)
+        result = bfunc.subtract_background(data, bkg)
+        self.assertEqual(result.shape, (3, 101))
+        self.assertTrue(np.issubdtype(result.dtype, np.floating))
+        np.testing.assert_array_equal(result[:2], data)
+        self.assertTrue(np.all(result[2,:10] == 0))
+        self.assertTrue(np.all(result[2,91:] == 0))
+        self.assertTrue(np.all(result[2] >= 0))
+        self.assertAlmostEqual(result[2,50], 5)
+
+    def test_small_integer_and_float32_data(self):
+        X = np.arange(0, 101)
+        for dtype,expected in ((np.int16, np.float64), (np.uint8, np.float64),
+                               (np.float32, np.float32)):
+            data = np.vstack((X, 10 + X//2)).astype(dtype)
+            bkg = background([10, 90], [10, 50])
+            bfunc.calculate_background(data, bkg)
+            self.assertEqual(bkg.curve.Y.dtype, expected)
+            result = bfunc.subtract_background(data, bkg)
+            self.assertEqual(result.dtype, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
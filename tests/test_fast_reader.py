@@ -0,0 +1,100 @@
+'''
+Tests of the fast reader of input files in bground.ui module.
+
+The fast reader is used only with old numpy versions (< 1.23),
+but it is tested directly, with any numpy version,
+against the reference = numpy.loadtxt.
+'''
+
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from bground import ui
+
+
+FILE_CONTENT = '''\
+# XY-data with a header line
+# and one more comment line
+0.0   1.5   10.0
+1.0   2.5   20.0
+# comment between the data
+2.0   3.5   30.0
+3.0   4.5   40.0   # comment after the data
+4.0   5.5   50.0
+'''
+
+
+class FastReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.infile = os.path.join(self.tmpdir.name, 'in.txt')
+        with open(self.infile, 'w') as f: f.write(FILE_CONTENT)
+
+    def assert_same_as_loadtxt(self, **kwargs):
+        expected = np.loadtxt(self.infile, **kwargs)
+        result = ui._read_input_file_fast(self.infile, **kwargs)
+        self.assertEqual(result.shape, expected.shape)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_default(self):
+        self.assert_same_as_loadtxt()
+
+    def test_unpack(self):
+        self.assert_same_as_loadtxt(unpack=True)
+
+    def test_usecols(self):
+        self.assert_same_as_loadtxt(usecols=[0,2], unpack=True)
+        self.assert_same_as_loadtxt(usecols=[2,0], unpack=True)
+        self.assert_same_as_loadtxt(usecols=[1])
+
+    def test_skiprows(self):
+        self.assert_same_as_loadtxt(skiprows=2)
+        self.assert_same_as_loadtxt(skiprows=3, unpack=True)
+
+    def test_unsupported_arguments(self):
+        # max_rows => different meaning in old np.loadtxt and pandas
+        self.assertFalse(ui._fast_reader_can_read({'max_rows':2}))
+        self.assertFalse(ui._fast_reader_can_read({'converters':{}}))
+        self.assertFalse(ui._fast_reader_can_read({'dtype':int}))
+        self.assertTrue(ui._fast_reader_can_read(
+            {'unpack':True, 'usecols':[0,1], 'skiprows':2}))
+
+    def test_comments_and_delimiter(self):
+        infile = os.path.join(self.tmpdir.name, 'in.csv')
+        with open(infile, 'w') as f:
+            f.write('% header\n0.0,1.5\n1.0,2.5\n% comment\n2.0,3.5\n')
+        kwargs = dict(comments='%', delimiter=',', unpack=True)
+        np.testing.assert_array_equal(
+            ui._read_input_file_fast(infile, **kwargs),
+            np.loadtxt(infile, **kwargs))
+
+    def test_file_object(self):
+        expected = np.loadtxt(self.infile, unpack=True)
+        result = ui._read_input_file_fast(
+            io.StringIO(FILE_CONTENT), unpack=True)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_full_precision(self):
+        X = np.random.default_rng(1).random((50,2))
+        infile = os.path.join(self.tmpdir.name, 'random.txt')
+        np.savetxt(infile, X, fmt='%.17g')
+        np.testing.assert_array_equal(
+            ui._read_input_file_fast(infile), np.loadtxt(infile))
+
+    def test_fast_reader_in_load_input_file(self):
+        saved = ui._SLOW_LOADTXT
+        self.addCleanup(setattr, ui, '_SLOW_LOADTXT', saved)
+        ui._SLOW_LOADTXT = True
+        np.testing.assert_array_equal(
+            ui._load_input_file(self.infile, unpack=True),
+            np.loadtxt(self.infile, unpack=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
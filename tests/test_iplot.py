@@ -0,0 +1,99 @@
+'''
+Tests of bground.iplot module.
+'''
+
+import contextlib
+import io
+import os
+import tempfile
+import types
+import unittest
+
+import matplotlib; matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+import bground.ui as bkg
+from bground import bdata, iplot
+
+
+class KeypressTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(plt.close, 'all')
+        X = np.linspace(0, 200, 201)
+        Y = 100 + 50*np.exp(-(X-100)**2/50)
+        self.data = np.vstack((X,Y))
+        self.basename = os.path.join(self.tmpdir.name, 'out')
+        self.ppar = bkg.PlotParams(self.basename, 'X', 'Y')
+        self.ppar.messages = False
+        self.bkgr = bdata.XYbackground(
+            self.basename, points=bdata.XYpoints(), curve=bdata.XYcurve())
+        self.fig, self.ax = iplot.interactive_plot(
+            self.data, self.bkgr, self.ppar)
+
+    def key(self, key, xm=100, ym=100):
+        event = types.SimpleNamespace(key=key, xdata=xm, ydata=ym)
+        iplot.on_keypress(
+            event, self.fig, self.ax, self.data, self.bkgr, self.ppar)
+
+    def test_messages(self):
+        self.ppar.messages = True
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.key('x')
+        self.assertEqual(out.getvalue(), '')
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.key('1', None, None)
+        self.assertIn('mouse outside plot area', out.getvalue())
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.key('1', 50, 0)
+        self.assertIn('background point added', out.getvalue())
+
+    def test_all_keys_have_the_same_arguments(self):
+        for x in (20, 60, 140, 180): self.bkgr.points.add_point(x, 100)
+        for key in '123456':
+            function = iplot.KEYPRESS_FUNCTIONS[key]
+            function(self.ax, self.data, self.bkgr, self.ppar, 100, 100)
+        self.assertEqual(self.bkgr.btype, 'cubic')
+
+    def test_lines_are_updated(self):
+        self.assertIsNone(getattr(self.ax, '_pts_line', None))
+        for x in (150, 20, 100): self.key('1', x, 0)
+        X,Y = self.bkgr.points_line.get_data()
+        np.testing.assert_array_equal(X, [20, 100, 150])
+        self.key('4')
+        X,Y = self.bkgr.curve_line.get_data()
+        np.testing.assert_array_equal(X, self.data[0,20:151])
+        self.key('3')
+        X,Y = self.bkgr.curve_line.get_data()
+        self.assertEqual(len(X), 0)
+
+    def test_load_add_point_and_save(self):
+        # Unsorted points in BKG-file (such as a manually edited file)
+        with open(self.basename + '.bkg', 'w') as f:
+            f.write('X\tY\n150\t90\n20\t80\n100\t60\n')
+        for btype in ('linear', 'cubic'):
+            self.key('a')
+            self.key('1', 180, 100)
+            self.bkgr.btype = btype
+            self.key('t')
+            X = np.array([20, 100, 150, 180])
+            np.testing.assert_array_equal(self.bkgr.points.X, X)
+            TXT, _, _ = bdata.output_filenames(self.basename)
+            with open(TXT) as f: header = f.read().splitlines()[1]
+            self.assertIn(btype, header)
+            result = np.loadtxt(TXT, unpack=True)
+            Xdata = self.data[0]
+            inside = (Xdata >= 20) & (Xdata <= 180)
+            self.assertTrue(np.all(result[2,~inside] == 0))
+            # Background at the points => corrected data = data - points
+            idx = np.searchsorted(Xdata, X)
+            Yexpected = np.maximum(
+                self.data[1,idx] - np.array([80, 60, 90, 100]), 0)
+            np.testing.assert_allclose(result[2,idx], Yexpected, rtol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
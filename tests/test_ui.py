@@ -0,0 +1,152 @@
+'''
+Tests of bground.ui module.
+'''
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import matplotlib; matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+import bground.ui as bkg
+
+
+class InputDataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.XY = np.column_stack((np.arange(20.0), np.arange(20.0)**2))
+        self.txtfile = os.path.join(self.tmpdir.name, 'in.txt')
+        self.npyfile = os.path.join(self.tmpdir.name, 'in.npy')
+        np.savetxt(self.txtfile, self.XY)
+        np.save(self.npyfile, self.XY)
+
+    def test_npy_file(self):
+        data = bkg.InputData(self.npyfile).data
+        self.assertNotIsInstance(data, np.memmap)
+        self.assertTrue(data.flags.c_contiguous)
+        np.testing.assert_array_equal(data, bkg.InputData(self.txtfile).data)
+        data = bkg.InputData(self.npyfile, skiprows=5, max_rows=10).data
+        np.testing.assert_array_equal(data, self.XY[5:15].T)
+
+    def test_data_can_be_modified(self):
+        DATA1 = bkg.InputData(self.txtfile)
+        DATA2 = bkg.InputData(self.txtfile)
+        DATA1.data[1] -= 1
+        np.testing.assert_array_equal(DATA1.data[1], self.XY[:,1] - 1)
+        np.testing.assert_array_equal(DATA2.data[1], self.XY[:,1])
+        np.testing.assert_array_equal(
+            bkg.InputData(self.txtfile).data[1], self.XY[:,1])
+
+
+class InteractivePlotHelpTest(unittest.TestCase):
+
+    # Methods and the texts, which must be in their output
+    HELP_METHODS = {
+        'print_general_help'              : 'General description',
+        'print_how_it_works'              : 'How it works?',
+        'print_all_keyboard_shortcuts'    : 'Keyboard shortcuts',
+        'print_info_about_more_help_on_www': 'Additional help on www'}
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        infile = os.path.join(tmpdir.name, 'in.txt')
+        np.savetxt(infile, np.column_stack((np.arange(5.0), np.ones(5))))
+        self.iplot = bkg.InteractivePlot(
+            bkg.InputData(infile), bkg.PlotParams('out', 'X', 'Y'),
+            messages=False)
+
+    def test_help_on_class_and_instance(self):
+        for owner in (bkg.InteractivePlot, self.iplot):
+            for name,text in self.HELP_METHODS.items():
+                with self.subTest(owner=owner, method=name):
+                    with contextlib.redirect_stdout(io.StringIO()) as out:
+                        getattr(owner, name)()
+                    self.assertIn(text, out.getvalue())
+
+    def test_keyboard_shortcuts_with_output_file(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.iplot.print_all_keyboard_shortcuts('my_file')
+        self.assertIn('my_file.txt', out.getvalue())
+        self.assertIn('my_file.bkg', out.getvalue())
+
+
+class InteractivePlotPreviewTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(plt.close, 'all')
+        X = np.linspace(0, 200, 201)
+        Y = 100 + 50*np.exp(-(X-100)**2/50)
+        self.infile = os.path.join(self.tmpdir.name, 'in.txt')
+        np.savetxt(self.infile, np.column_stack((X,Y)))
+        DATA = bkg.InputData(self.infile)
+        PPAR = bkg.PlotParams(
+            os.path.join(self.tmpdir.name, 'out'), 'X', 'Y')
+        self.iplot = bkg.InteractivePlot(DATA, PPAR, messages=False)
+        for x in (0, 100, 200): self.iplot.background.points.add_point(x, 90)
+        import bground.bfunc
+        bground.bfunc.calculate_background(
+            self.iplot.data.data, self.iplot.background)
+
+    def test_limits_are_reset_after_explicit_limits(self):
+        self.iplot.plot_data_after_bkgr_subtraction(xlim=(0,50))
+        self.assertEqual(self.iplot._preview_ax.get_xlim(), (0,50))
+        self.iplot.plot_data_after_bkgr_subtraction()
+        xmin, xmax = self.iplot._preview_ax.get_xlim()
+        self.assertLessEqual(xmin, 0)
+        self.assertGreaterEqual(xmax, 200)
+
+    def test_subtraction_of_integer_data(self):
+        infile = os.path.join(self.tmpdir.name, 'in_int.txt')
+        X,Y = self.iplot.data.data
+        np.savetxt(infile, np.column_stack((X,Y)), fmt='%d')
+        self.iplot.data = bkg.InputData(infile, dtype=int)
+        self.iplot.plot_data_after_bkgr_subtraction()
+        data_corr = self.iplot._sub_cache[1]
+        self.assertTrue(np.issubdtype(data_corr.dtype, np.floating))
+        self.assertTrue(np.all(data_corr[2] >= 0))
+
+    def test_subtraction_is_repeated_for_new_data(self):
+        self.iplot.plot_data_after_bkgr_subtraction()
+        old_result = self.iplot._sub_cache[1].copy()
+        infile = os.path.join(self.tmpdir.name, 'in2.txt')
+        X,Y = self.iplot.data.data
+        np.savetxt(infile, np.column_stack((X,Y+10)))
+        self.iplot.data = bkg.InputData(infile)
+        self.iplot.plot_data_after_bkgr_subtraction()
+        new_result = self.iplot._sub_cache[1]
+        np.testing.assert_allclose(
+            new_result[2,1:-1], old_result[2,1:-1] + 10)
+
+    def test_subtraction_is_repeated_for_modified_data(self):
+        self.iplot.plot_data_after_bkgr_subtraction()
+        old_result = self.iplot._sub_cache[1].copy()
+        self.iplot.data.data[1] += 1000
+        self.iplot.plot_data_after_bkgr_subtraction()
+        new_result = self.iplot._sub_cache[1]
+        np.testing.assert_allclose(
+            new_result[2,1:-1], old_result[2,1:-1] + 1000)
+
+    def test_subtraction_is_repeated_for_recalculated_curve(self):
+        import bground.bfunc
+        bkgr = self.iplot.background
+        self.iplot.plot_data_after_bkgr_subtraction()
+        bkgr.points.add_point(50, 50)
+        self.iplot.plot_data_after_bkgr_subtraction()
+        bground.bfunc.calculate_background(self.iplot.data.data, bkgr)
+        self.iplot.plot_data_after_bkgr_subtraction()
+        data_corr = self.iplot._sub_cache[1]
+        Y50 = self.iplot.data.data[1,50]
+        self.assertAlmostEqual(data_corr[2,50], Y50 - 50)
+
+
+if __name__ == '__main__':
+    unittest.main()